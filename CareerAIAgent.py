@@ -4,27 +4,155 @@
 # In[ ]:
 
 
-from openai import OpenAI
+import asyncio
+import logging
+import os
+import threading
+import httpx
+from openai import AsyncOpenAI
 import json
-from typing import List, Dict, Optional
+import orjson
+import re
+from collections import deque
+from typing import AsyncIterator, Iterator, List, Dict, Optional
 from datetime import datetime
 
+log = logging.getLogger("careerai")
+
+# Clients are cached per API key so Streamlit reruns/resets reuse the
+# same httpx connection pool instead of paying TLS setup again
+_CLIENT_CACHE: Dict[str, AsyncOpenAI] = {}
+_WARMED_KEYS: set = set()
+
+# All async work runs on one persistent background-thread loop. The
+# pooled keep-alive connections are bound to the loop that created
+# them, so per-call asyncio.run() loops would poison the pool: the
+# second call would reuse a connection from a closed loop and raise
+# "RuntimeError: Event loop is closed".
+_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_LOOP_LOCK = threading.Lock()
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared event loop, starting its thread on first use"""
+    global _LOOP
+    with _LOOP_LOCK:
+        if _LOOP is None or _LOOP.is_closed():
+            _LOOP = asyncio.new_event_loop()
+            threading.Thread(target=_LOOP.run_forever, daemon=True).start()
+    return _LOOP
+
+
+def _run_sync(coro):
+    """Run a coroutine to completion on the shared loop from sync code"""
+    return asyncio.run_coroutine_threadsafe(coro, _get_loop()).result()
+
+# Scenario turns for repeated careers/choices are cached here across
+# sessions so replays skip the LLM entirely
+_SCENARIO_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".scenario_cache.json")
+
+# Bounds on the agent interaction log: keep the last 64 entries, and keep
+# full reasoning text only on the most recent 8
+_AGENT_LOG_MAXLEN = 64
+_REASONING_KEEP = 8
+
+# Models often wrap their JSON in prose; grab the outermost {...} span
+_JSON_RE = re.compile(r"\{.*\}", re.S)
+
+
+def _extract_json(text: str) -> Dict:
+    """Parse the first JSON object found in text, or {} if none parses"""
+    m = _JSON_RE.search(text)
+    if not m:
+        return {}
+    try:
+        return orjson.loads(m.group(0))
+    except orjson.JSONDecodeError:
+        return {}
+
+
+def _json_default(obj):
+    """Serialize sets/deques as lists, everything else via str"""
+    if isinstance(obj, (set, deque)):
+        return list(obj)
+    return str(obj)
+
+def _get_client(api_key: str) -> AsyncOpenAI:
+    """Return a shared AsyncOpenAI client with connection pooling"""
+    if api_key not in _CLIENT_CACHE:
+        _CLIENT_CACHE[api_key] = AsyncOpenAI(
+            base_url="https://integrate.api.nvidia.com/v1",
+            api_key=api_key,
+            http_client=httpx.AsyncClient(
+                limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+                timeout=300
+            )
+        )
+    return _CLIENT_CACHE[api_key]
+
+
+async def _warm(client: AsyncOpenAI):
+    try:
+        await client.models.list()
+    except Exception:
+        pass
+
+
+def _prewarm_client(api_key: str):
+    """Prime the keep-alive socket with a cheap /models call so the first
+    real turn skips the TCP+TLS handshake. Fire-and-forget on the shared
+    loop — the warmed connection must live where the real calls run."""
+    if api_key in _WARMED_KEYS:
+        return
+    _WARMED_KEYS.add(api_key)
+    asyncio.run_coroutine_threadsafe(_warm(_CLIENT_CACHE[api_key]), _get_loop())
+
+
+async def _replay_text(text: str) -> AsyncIterator[str]:
+    """Wrap already-generated text as a one-shot token source"""
+    yield text
+
+
+def _iter_over_async(agen: AsyncIterator[str]) -> Iterator[str]:
+    """Drive an async token generator from sync code (Streamlit is sync),
+    pulling each token off the shared background loop"""
+    loop = _get_loop()
+    while True:
+        try:
+            yield asyncio.run_coroutine_threadsafe(agen.__anext__(), loop).result()
+        except StopAsyncIteration:
+            break
+
+
 class BaseAgent:
     """Base class for all specialized agents"""
-    def __init__(self, client: OpenAI, model: str, role: str):
+    def __init__(self, client: AsyncOpenAI, model: str, role: str,
+                 sem: asyncio.Semaphore = None, max_tokens: int = 1024,
+                 min_thinking: int = 256, max_thinking: int = 512):
         self.client = client
         self.model = model
         self.role = role
+        self.sem = sem or asyncio.Semaphore(1)
+        # Per-agent generation budgets: JSON-only agents need far fewer
+        # tokens than the narrative ones, and latency scales with tokens
+        self.max_tokens = max_tokens
+        self.min_thinking = min_thinking
+        self.max_thinking = max_thinking
         self.memory: List[Dict] = []
 
     def think_and_act(self, prompt: str, context: Dict = None) -> Dict:
+        """Sync wrapper around athink_and_act for non-async callers"""
+        return _run_sync(self.athink_and_act(prompt, context))
+
+    async def athink_and_act(self, prompt: str, context: Dict = None,
+                             context_json: str = None) -> Dict:
         """ReAct pattern: Reason → Act → Observe"""
         messages = [
             {"role": "system", "content": self.get_system_prompt()},
-            {"role": "user", "content": self._format_prompt(prompt, context)}
+            {"role": "user", "content": self._format_prompt(prompt, context, context_json)}
         ]
 
-        response = self._call_model(messages)
+        response = await self._acall_model(messages)
 
         return {
             "agent": self.role,
@@ -33,72 +161,109 @@ class BaseAgent:
             "timestamp": datetime.now().isoformat()
         }
 
-    def _call_model(self, messages: List[Dict]) -> Dict:
+    async def _acall_model(self, messages: List[Dict]) -> Dict:
         """Internal model call with reasoning extraction"""
-        completion = self.client.chat.completions.create(
-            model=self.model,
-            messages=messages,
-            temperature=0.7,
-            top_p=0.95,
-            max_tokens=1024,
-            stream=True,
-            extra_body={
-                "min_thinking_tokens": 256,
-                "max_thinking_tokens": 512
-            }
-        )
+        # Bound concurrent requests so parallel agents stay within the
+        # endpoint's rate limit
+        async with self.sem:
+            completion = await self.client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                temperature=0.7,
+                top_p=0.95,
+                max_tokens=self.max_tokens,
+                stream=True,
+                extra_body={
+                    "min_thinking_tokens": self.min_thinking,
+                    "max_thinking_tokens": self.max_thinking
+                }
+            )
 
-        reasoning = ""
-        content = ""
+            reasoning = ""
+            content = ""
 
-        for chunk in completion:
-            r = getattr(chunk.choices[0].delta, "reasoning_content", None)
-            if r:
-                reasoning += r
-            if chunk.choices[0].delta.content:
-                content += chunk.choices[0].delta.content
+            async for chunk in completion:
+                r = getattr(chunk.choices[0].delta, "reasoning_content", None)
+                if r:
+                    reasoning += r
+                if chunk.choices[0].delta.content:
+                    content += chunk.choices[0].delta.content
 
         return {"reasoning": reasoning, "content": content}
 
-    def get_system_prompt(self) -> str:
-        raise NotImplementedError
-
-    def _format_prompt(self, prompt: str, context: Dict = None) -> str:
-        if context:
-            return f"Context: {json.dumps(context)}\n\nTask: {prompt}"
-        return prompt
+    async def astream_tokens(self, prompt: str, context: Dict = None) -> AsyncIterator[str]:
+        """Stream content tokens as they arrive (reasoning is dropped).
 
+        Use for user-facing prose; agents whose JSON must be parsed
+        whole should stick with athink_and_act."""
+        messages = [
+            {"role": "system", "content": self.get_system_prompt()},
+            {"role": "user", "content": self._format_prompt(prompt, context)}
+        ]
 
-class CareerResearchAgent(BaseAgent):
-    """Researches career details and determines what information is needed"""
-    def get_system_prompt(self) -> str:
-        return """You are a Career Research Agent. Your job:
-1. DECIDE if you have enough information about the career to create realistic scenarios
-2. If NOT, identify WHAT specific information you need (typical day, common challenges, required skills, tools used)
-3. Output your decision and reasoning
+        async for token in self._astream_model(messages):
+            yield token
+
+    async def _astream_model(self, messages: List[Dict]) -> AsyncIterator[str]:
+        """Internal streaming model call yielding content deltas"""
+        async with self.sem:
+            completion = await self.client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                temperature=0.7,
+                top_p=0.95,
+                max_tokens=self.max_tokens,
+                stream=True,
+                extra_body={
+                    "min_thinking_tokens": self.min_thinking,
+                    "max_thinking_tokens": self.max_thinking
+                }
+            )
 
-Use /think to analyze what's known vs needed. Output JSON:
-{"needs_research": true/false, "missing_info": [...], "known_info": {...}}"""
+            async for chunk in completion:
+                if chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
 
+    # Set by subclasses; interned once per class so every call sends the
+    # byte-identical prefix (helps server-side prompt/KV-cache hits)
+    SYSTEM_PROMPT: Optional[str] = None
 
-class ScenarioDesignerAgent(BaseAgent):
-    """Designs realistic, challenging career scenarios"""
     def get_system_prompt(self) -> str:
-        return """You are a Scenario Designer Agent. Create realistic, challenging scenarios for career simulations.
+        if self.SYSTEM_PROMPT is None:
+            raise NotImplementedError
+        return self.SYSTEM_PROMPT
+
+    def _format_prompt(self, prompt: str, context: Dict = None,
+                       context_json: str = None) -> str:
+        # Fast path: callers with an already-serialized context (e.g. the
+        # simulator's cached state JSON) skip re-serializing per call
+        if context_json is not None:
+            return f"Context: {context_json}\n\nTask: {prompt}"
+        if context:
+            return f"Context: {orjson.dumps(context, default=_json_default).decode()}\n\nTask: {prompt}"
+        return prompt
+
+
+class ScenarioNarratorAgent(BaseAgent):
+    """Designs the next scenario and narrates it in a single call"""
+    SYSTEM_PROMPT = """You are a Scenario Narrator Agent. In ONE response you design a realistic, challenging career scenario AND narrate it as an immersive story.
 
 For each scenario, include:
 - Realistic problem/situation
 - 3-4 decision options with trade-offs
 - Hidden complexity that reveals career realities
 
-Use /think to ensure authenticity. Output JSON:
-{"scenario": "...", "options": [...], "learning_goal": "..."}"""
+The narrative should feel real and engaging while being educational. Keep it 2-3 paragraphs.
+
+Use /think to ensure authenticity. Output EXACTLY this format:
+SCENARIO: {"scenario": "...", "options": [...], "learning_goal": "..."}
+NARRATIVE:
+<your narrative here>"""
 
 
 class EvaluationAgent(BaseAgent):
     """Evaluates user decisions and determines consequences"""
-    def get_system_prompt(self) -> str:
-        return """You are an Evaluation Agent. Analyze user decisions in career scenarios.
+    SYSTEM_PROMPT = """You are an Evaluation Agent. Analyze user decisions in career scenarios.
 
 Consider:
 - Immediate consequences
@@ -107,55 +272,72 @@ Consider:
 - Skills demonstrated (or lacking)
 
 Use /think to reason about realistic outcomes. Output JSON:
-{"consequence": "...", "skills_used": [...], "professional_insight": "..."}"""
+{"consequence": "...", "drastic": true/false, "skills_used": [...], "professional_insight": "..."}
 
+Set "drastic" to true only when the consequence sharply changes the situation (e.g. a crisis, firing, major win) rather than continuing the day as expected."""
 
-class NarratorAgent(BaseAgent):
-    """Synthesizes information into engaging narrative"""
-    def get_system_prompt(self) -> str:
-        return """You are a Narrator Agent. Transform scenario data into immersive storytelling.
 
-Make it feel real and engaging while being educational. Keep responses 2-3 paragraphs.
-Use /think to craft compelling narrative that teaches."""
+class SummaryAgent(BaseAgent):
+    """Produces the end-of-day skills and story summary in one call"""
+    SYSTEM_PROMPT = """You are a Summary Agent. Review a completed career-day simulation and produce BOTH a skills assessment and an engaging story recap in one response.
+
+The recap should feel real and educational, 2-3 paragraphs. Use /think to reflect on the day's decisions. Output JSON:
+{"skills_summary": "...", "narrative": "..."}"""
 
 
 class MultiAgentCareerSimulator:
     """Orchestrator for multi-agent career simulation"""
     def __init__(self, api_key: str):
-        self.client = OpenAI(
-            base_url="https://integrate.api.nvidia.com/v1",
-            api_key=api_key
-        )
+        self.client = _get_client(api_key)
+        _prewarm_client(api_key)
         self.model = "nvidia/nvidia-nemotron-nano-9b-v2"
+        self.sem = asyncio.Semaphore(int(os.getenv("AGENT_CONCURRENCY", "4")))
 
-        # Initialize specialized agents
-        self.research_agent = CareerResearchAgent(self.client, self.model, "Research")
-        self.scenario_agent = ScenarioDesignerAgent(self.client, self.model, "Scenario Designer")
-        self.evaluator = EvaluationAgent(self.client, self.model, "Evaluator")
-        self.narrator = NarratorAgent(self.client, self.model, "Narrator")
+        # Initialize specialized agents (shared client + rate-limit semaphore)
+        self.scenario_narrator = ScenarioNarratorAgent(self.client, self.model, "Scenario Narrator", self.sem)
+        self.evaluator = EvaluationAgent(self.client, self.model, "Evaluator", self.sem,
+                                         max_tokens=256, min_thinking=64, max_thinking=128)
+        self.summary_agent = SummaryAgent(self.client, self.model, "Summary", self.sem)
 
         self.career_knowledge: Dict = {}
         self.simulation_state: Dict = {
             "time": "9:00 AM",
             "scenarios_completed": 0,
-            "skills_demonstrated": [],
+            "skills_demonstrated": set(),
             "current_scenario": None
         }
-        self.agent_log: List[Dict] = []
+        self.agent_log: deque = deque(maxlen=_AGENT_LOG_MAXLEN)
+        self._scenario_cache: Dict[str, Dict] = self._load_scenario_cache()
+        self._state_json_cache = ""
+        self._bump_state()
+
+    def _bump_state(self):
+        """Re-serialize simulation_state; call after any state mutation"""
+        self._state_json_cache = orjson.dumps(self.simulation_state, default=_json_default).decode()
+
+    def _log(self, entry: Dict):
+        """Append to the bounded agent log, dropping reasoning text once
+        an entry ages out of the most recent window"""
+        self.agent_log.append(entry)
+        if len(self.agent_log) > _REASONING_KEEP:
+            self.agent_log[-_REASONING_KEEP - 1]["reasoning"] = ""
 
     def start_simulation(self, career: str) -> str:
-        """Initialize simulation with agentic research workflow"""
-        print(f"\n🤖 [Research Agent] Analyzing career: {career}...")
+        """Sync wrapper around astart_simulation for non-async callers"""
+        return _run_sync(self.astart_simulation(career))
 
-        # Step 1: Research Agent decides if it needs more info (Agentic RAG)
-        research_result = self.research_agent.think_and_act(
-            f"Do we have enough information to simulate a day as a {career}? What do we need to know?",
-            {"career": career}
-        )
-        self.agent_log.append(research_result)
-        print(f"   Reasoning: {research_result['reasoning'][:100]}...")
+    def start_simulation_stream(self, career: str) -> Iterator[str]:
+        """Stream the opening narrative token by token (for st.write_stream)"""
+        return _iter_over_async(self.astart_simulation_stream(career))
+
+    async def astart_simulation(self, career: str) -> str:
+        return "".join([tok async for tok in self.astart_simulation_stream(career)])
 
-        # Parse research needs (in real implementation, this would trigger tool calls)
+    async def astart_simulation_stream(self, career: str) -> AsyncIterator[str]:
+        """Initialize simulation with a single scenario+narrative call"""
+        log.debug("[Scenario Narrator] Creating opening scenario...")
+
+        # Career knowledge is assembled locally — no research call needed
         self.career_knowledge = {
             "career": career,
             "researched": True,
@@ -163,117 +345,231 @@ class MultiAgentCareerSimulator:
             "tools": f"Tools used in {career}"
         }
 
-        # Step 2: Scenario Designer creates first scenario
-        print(f"\n🎨 [Scenario Designer] Creating opening scenario...")
-        scenario_result = self.scenario_agent.think_and_act(
-            f"Design an engaging opening scenario for a {career}'s day at 9 AM",
-            self.career_knowledge
-        )
-        self.agent_log.append(scenario_result)
+        async for token in self._run_scenario_turn(
+            f"Design and narrate an engaging opening scenario for a {career}'s day at 9 AM",
+            self.career_knowledge,
+            cache_key=f"{career.lower().strip()}|9:00 AM"
+        ):
+            yield token
 
-        # Step 3: Narrator makes it engaging
-        print(f"\n📖 [Narrator] Crafting narrative...")
-        narrative_result = self.narrator.think_and_act(
-            f"Present this scenario engagingly: {scenario_result['action']}",
-            {"career": career, "time": "9:00 AM"}
-        )
-        self.agent_log.append(narrative_result)
+    def process_user_decision(self, user_choice: str) -> str:
+        """Sync wrapper around aprocess_user_decision for non-async callers"""
+        return _run_sync(self.aprocess_user_decision(user_choice))
 
-        self.simulation_state["current_scenario"] = scenario_result
+    def process_user_decision_stream(self, user_choice: str) -> Iterator[str]:
+        """Stream the turn's narrative token by token (for st.write_stream)"""
+        return _iter_over_async(self.aprocess_user_decision_stream(user_choice))
 
-        return narrative_result['action']
+    async def aprocess_user_decision(self, user_choice: str) -> str:
+        return "".join([tok async for tok in self.aprocess_user_decision_stream(user_choice)])
 
-    def process_user_decision(self, user_choice: str) -> str:
+    async def aprocess_user_decision_stream(self, user_choice: str) -> AsyncIterator[str]:
         """ReAct loop: Evaluate → Generate consequence → Create next scenario"""
-        print(f"\n⚖️ [Evaluator] Analyzing decision...")
-
-        # Step 1: Evaluator analyzes the decision
-        eval_result = self.evaluator.think_and_act(
-            f"User chose: '{user_choice}'. Evaluate this decision.",
-            {
-                "scenario": self.simulation_state["current_scenario"],
-                "career": self.career_knowledge["career"]
-            }
-        )
-        self.agent_log.append(eval_result)
-        print(f"   Reasoning: {eval_result['reasoning'][:100]}...")
-
-        # Update simulation state based on evaluation
+        log.debug("[Evaluator] Analyzing decision...")
+
+        career = self.career_knowledge["career"]
+        next_time = self._peek_next_time()
+        cache_key = f"{career.lower().strip()}|{next_time}|{user_choice.lower().strip()[:64]}"
+        turn_prompt = f"Tell the story of what happened after the user's choice and design+narrate the next scenario"
+
+        # Speculation: the next scenario usually depends only mildly on
+        # the evaluator's verdict, so draft it from the choice alone
+        # while the evaluator runs. Kept unless the consequence turns
+        # out to be drastic (or a cached turn makes it moot).
+        speculative_task = None
+        if cache_key not in self._scenario_cache:
+            speculative_task = asyncio.create_task(self._collect_stream(
+                self.scenario_narrator.astream_tokens(turn_prompt, {
+                    "previous_choice": user_choice,
+                    "time": next_time,
+                    "career": career
+                })
+            ))
+
+        # Step 1: Evaluator analyzes the decision. If it fails, reap the
+        # speculative task so no orphaned HTTP stream outlives the turn
         try:
-            eval_data = json.loads(eval_result['action'])
-            self.simulation_state["skills_demonstrated"].extend(
-                eval_data.get("skills_used", [])
+            eval_result = await self.evaluator.athink_and_act(
+                f"User chose: '{user_choice}'. Evaluate this decision.",
+                {
+                    "scenario": self.simulation_state["current_scenario"],
+                    "career": career
+                }
             )
-        except:
-            pass
+        except BaseException:
+            if speculative_task is not None:
+                speculative_task.cancel()
+            raise
+        self._log(eval_result)
+        log.debug("Reasoning: %.100s...", eval_result['reasoning'])
+
+        # Update simulation state based on evaluation — tolerate prose
+        # around the JSON instead of silently dropping the skill data
+        eval_data = _extract_json(eval_result['action'])
+        self.simulation_state["skills_demonstrated"].update(
+            eval_data.get("skills_used", [])
+        )
+        self._bump_state()
 
-        # Step 2: Decide if we need a new scenario or continue current one
-        print(f"\n🎨 [Scenario Designer] Planning next step...")
+        # Step 2: One fused call designs the next scenario and narrates
+        # the consequence — a single LLM round trip instead of two
+        log.debug("[Scenario Narrator] Planning next step...")
         self.simulation_state["scenarios_completed"] += 1
         self.simulation_state["time"] = self._advance_time()
-
-        next_scenario = self.scenario_agent.think_and_act(
-            f"Create next scenario based on the consequence of user's choice",
+        self._bump_state()
+
+        token_source = None
+        if speculative_task is not None:
+            if eval_data.get("drastic"):
+                # Consequence invalidates the draft — discard and redo
+                # with the evaluator's verdict in context
+                speculative_task.cancel()
+            else:
+                token_source = _replay_text(await speculative_task)
+
+        async for token in self._run_scenario_turn(
+            turn_prompt,
             {
                 "previous_choice": user_choice,
                 "consequence": eval_result['action'],
                 "time": self.simulation_state["time"],
-                "career": self.career_knowledge["career"]
-            }
-        )
-        self.agent_log.append(next_scenario)
+                "career": career
+            },
+            cache_key=cache_key,
+            token_source=token_source
+        ):
+            yield token
+
+    async def _collect_stream(self, agen: AsyncIterator[str]) -> str:
+        return "".join([tok async for tok in agen])
+
+    def _peek_next_time(self) -> str:
+        """Time the clock will show after the upcoming scenario"""
+        idx = min(self.simulation_state["scenarios_completed"] + 1, len(self.DAY_TIMES) - 1)
+        return self.DAY_TIMES[idx]
+
+    async def _run_scenario_turn(self, prompt: str, context: Dict,
+                                 cache_key: str = None,
+                                 token_source: AsyncIterator[str] = None) -> AsyncIterator[str]:
+        """Run the fused scenario+narrator call, storing the scenario JSON
+        and streaming only the narrative tokens.
+
+        The agent emits `SCENARIO: {...}` then `NARRATIVE:`; everything up
+        to the marker is buffered and parsed, the rest streams through.
+        Cache hits replay the stored turn without an LLM call."""
+        cached = self._scenario_cache.get(cache_key) if cache_key else None
+        if cached:
+            log.debug("Scenario cache hit: %s", cache_key)
+            self.simulation_state["current_scenario"] = cached["scenario"]
+            self._bump_state()
+            self._log({
+                "agent": self.scenario_narrator.role,
+                "reasoning": "",
+                "action": cached["narrative"],
+                "timestamp": datetime.now().isoformat()
+            })
+            yield cached["narrative"]
+            return
+
+        if token_source is None:
+            token_source = self.scenario_narrator.astream_tokens(prompt, context)
+
+        buffer = ""
+        narrating = False
+        tokens = []
+
+        async for token in token_source:
+            if narrating:
+                tokens.append(token)
+                yield token
+                continue
+            buffer += token
+            if "NARRATIVE:" in buffer:
+                header, _, rest = buffer.partition("NARRATIVE:")
+                self._store_scenario(header)
+                narrating = True
+                rest = rest.lstrip("\n")
+                if rest:
+                    tokens.append(rest)
+                    yield rest
+
+        if not narrating:
+            # Model ignored the format — surface the whole response
+            self._store_scenario(buffer)
+            tokens.append(buffer)
+            yield buffer
+
+        self._log({
+            "agent": self.scenario_narrator.role,
+            "reasoning": "",
+            "action": "".join(tokens),
+            "timestamp": datetime.now().isoformat()
+        })
 
-        # Step 3: Narrator weaves it together
-        print(f"\n📖 [Narrator] Creating narrative...")
-        narrative = self.narrator.think_and_act(
-            f"Tell the story of what happened after their choice and introduce the new scenario",
-            {
-                "choice": user_choice,
-                "consequence": eval_result['action'],
-                "next_scenario": next_scenario['action']
+        if cache_key:
+            self._scenario_cache[cache_key] = {
+                "scenario": self.simulation_state["current_scenario"],
+                "narrative": "".join(tokens)
             }
-        )
-        self.agent_log.append(narrative)
+            self._save_scenario_cache()
+
+    def _load_scenario_cache(self) -> Dict[str, Dict]:
+        """Load the persisted scenario cache (empty on any failure)"""
+        try:
+            with open(_SCENARIO_CACHE_PATH) as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
 
-        self.simulation_state["current_scenario"] = next_scenario
+    def _save_scenario_cache(self):
+        """Persist the scenario cache for cross-session reuse"""
+        try:
+            with open(_SCENARIO_CACHE_PATH, "w") as f:
+                json.dump(self._scenario_cache, f)
+        except OSError:
+            pass
 
-        return narrative['action']
+    def _store_scenario(self, header: str):
+        """Extract the scenario JSON from the turn header, if present"""
+        self.simulation_state["current_scenario"] = _extract_json(header)
+        self._bump_state()
+
+    DAY_TIMES = ["9:00 AM", "10:30 AM", "12:00 PM", "2:00 PM", "4:00 PM", "5:30 PM"]
 
     def _advance_time(self) -> str:
         """Simple time progression"""
-        times = ["9:00 AM", "10:30 AM", "12:00 PM", "2:00 PM", "4:00 PM", "5:30 PM"]
-        idx = min(self.simulation_state["scenarios_completed"], len(times) - 1)
-        return times[idx]
+        idx = min(self.simulation_state["scenarios_completed"], len(self.DAY_TIMES) - 1)
+        return self.DAY_TIMES[idx]
 
     def generate_summary(self) -> Dict:
-        """Multi-agent summary generation"""
-        print(f"\n📊 [All Agents] Generating summary...")
-
-        # Each agent contributes to the summary
-        eval_summary = self.evaluator.think_and_act(
-            "Summarize the skills and decisions demonstrated",
-            self.simulation_state
-        )
-
-        narrative_summary = self.narrator.think_and_act(
-            "Create an engaging summary of the career day experience",
-            {
-                "state": self.simulation_state,
-                "evaluation": eval_summary['action']
-            }
+        """Sync wrapper around agenerate_summary for non-async callers"""
+        return _run_sync(self.agenerate_summary())
+
+    async def agenerate_summary(self) -> Dict:
+        """End-of-day summary in a single fused call"""
+        log.debug("[Summary Agent] Generating summary...")
+
+        # One call returns both the skills assessment and the story
+        # recap — one round trip and one prompt prefix instead of two
+        summary_result = await self.summary_agent.athink_and_act(
+            "Summarize the skills demonstrated and tell the story of the career day",
+            context_json=self._state_json_cache
         )
+        self._log(summary_result)
+        summary_data = _extract_json(summary_result['action'])
 
         return {
             "career": self.career_knowledge["career"],
             "scenarios_completed": self.simulation_state["scenarios_completed"],
-            "skills": list(set(self.simulation_state["skills_demonstrated"])),
-            "summary": narrative_summary['action'],
+            "skills": sorted(self.simulation_state["skills_demonstrated"]),
+            "skills_summary": summary_data.get("skills_summary", ""),
+            "summary": summary_data.get("narrative", summary_result['action']),
             "agent_interactions": len(self.agent_log)
         }
 
     def get_agent_log(self) -> List[Dict]:
-        """Return full agent interaction log for evaluation/debugging"""
-        return self.agent_log
+        """Return the recent agent interaction log for evaluation/debugging"""
+        return list(self.agent_log)
 
 
 # Multi-agent coordination
@@ -284,7 +580,7 @@ def main():
 
     print("=" * 70)
     print("🎯 MULTI-AGENT CAREER SIMULATION SYSTEM")
-    print("   Powered by: Research → Design → Evaluate → Narrate Agents")
+    print("   Powered by: Evaluate → Design+Narrate Agents")
     print("=" * 70)
 
     career = input("\n🎬 What career would you like to experience? ")
@@ -1,7 +1,17 @@
+import logging
+import os
+
 import streamlit as st
-from openai import OpenAI
 from CareerAIAgent import MultiAgentCareerSimulator
 
+logging.basicConfig(level=os.getenv("LOGLEVEL", "WARNING"))
+
+def _render_messages():
+    """Render the conversation history"""
+    for msg in st.session_state.messages:
+        with st.chat_message(msg["role"]):
+            st.markdown(msg["content"])
+
 def main():
     st.set_page_config(page_title="Day in the Life Simulator", page_icon="🎯")
     
@@ -9,10 +19,9 @@ def main():
     st.markdown("Experience a day in any career with AI agents")
     
     # Initialize session state
-    if 'simulator' not in st.session_state:
-        st.session_state.simulator = None
-        st.session_state.started = False
-        st.session_state.messages = []
+    st.session_state.setdefault('simulator', None)
+    st.session_state.setdefault('started', False)
+    st.session_state.setdefault('messages', [])
     
     # API Key input (sidebar)
     with st.sidebar:
@@ -30,17 +39,15 @@ def main():
         career = st.text_input("🎬 What career would you like to experience?", placeholder="e.g., Software Engineer, Chef, Doctor")
         
         if st.button("Start Simulation") and career and api_key:
-            with st.spinner("🤖 Agents analyzing career..."):
-                st.session_state.simulator = MultiAgentCareerSimulator(api_key)
-                opening = st.session_state.simulator.start_simulation(career)
-                st.session_state.messages.append({"role": "assistant", "content": opening})
-                st.session_state.started = True
+            st.session_state.simulator = MultiAgentCareerSimulator(api_key)
+            with st.chat_message("assistant"):
+                opening = st.write_stream(st.session_state.simulator.start_simulation_stream(career))
+            st.session_state.messages.append({"role": "assistant", "content": opening})
+            st.session_state.started = True
             st.rerun()
     
     # Display conversation
-    for msg in st.session_state.messages:
-        with st.chat_message(msg["role"]):
-            st.markdown(msg["content"])
+    _render_messages()
     
     # User input
     if st.session_state.started and st.session_state.simulator:
@@ -49,12 +56,18 @@ def main():
             
             if user_input:
                 st.session_state.messages.append({"role": "user", "content": user_input})
-                
-                with st.spinner("🤖 Agents processing..."):
-                    response = st.session_state.simulator.process_user_decision(user_input)
-                    st.session_state.messages.append({"role": "assistant", "content": response})
-                
-                st.rerun()
+                with st.chat_message("user"):
+                    st.markdown(user_input)
+
+                # The streamed bubbles above are already on screen, so a
+                # rerun is only needed when the day just ended and the
+                # completion UI has to replace the stale chat input
+                with st.chat_message("assistant"):
+                    response = st.write_stream(st.session_state.simulator.process_user_decision_stream(user_input))
+                st.session_state.messages.append({"role": "assistant", "content": response})
+
+                if st.session_state.simulator.simulation_state["scenarios_completed"] >= 5:
+                    st.rerun()
         else:
             st.success("🏆 Career day complete!")
             if st.button("Generate Summary"):